@@ -38,17 +38,16 @@ class WordPressHealthMonitor:
     def __init__(self, site_url: str, wp_cli_path: str = "/usr/local/bin/wp"):
         self.site_url = site_url.rstrip('/')
         self.wp_cli = wp_cli_path
-        self.is_root = subprocess.run(['id', '-u'], capture_output=True, text=True).stdout.strip() == '0'
+        self.is_root = getattr(os, 'geteuid', lambda: -1)() == 0
         self.wp_command = f"{self.wp_cli} {'--allow-root' if self.is_root else ''} --skip-themes --skip-plugins"
         self.report = {}
         
     def run_wp_command(self, command: str, timeout: int = 10) -> str:
-        """Execute WP-CLI command with timeout"""
+        """Execute WP-CLI command with timeout (argv form, no shell)"""
         try:
             full_command = f"{self.wp_command} --url={self.site_url} {command}"
             result = subprocess.run(
-                full_command,
-                shell=True,
+                shlex.split(full_command),
                 capture_output=True,
                 text=True,
                 timeout=timeout
@@ -2628,7 +2627,9 @@ class HealthReportGenerator:
         try:
             os.makedirs(self.output_path, exist_ok=True)
             
-            with open(filepath, 'w') as f:
+            # json.dump with indent emits thousands of tiny writes; a
+            # 256KB stdio buffer coalesces them into a handful of syscalls
+            with open(filepath, 'w', buffering=262144) as f:
                 json.dump(self.report, f, indent=2)
             
             print(f"\n{Colors.GREEN}Report saved to: {filepath}{Colors.RESET}")